@@ -23,27 +23,34 @@ def load_api_token(config_path):
         raise
 
 
+HEADING_REGEX = re.compile(r'^(#+)\s+(.*)', re.MULTILINE)
+
+
 def parse_headings(md_text):
-    """Return a list of (level, title) pairs from Markdown text."""
+    """Return a list of (level, title) pairs from Markdown text.
+
+    The level is the number of '#' characters.
+    """
+
+    return [(len(m.group(1)), m.group(2).strip()) for m in HEADING_REGEX.finditer(md_text)]
 
-    pattern = re.compile(r'^(#+)\s+(.*)', re.MULTILINE)
-    return [(len(m.group(1)) * '#', m.group(2).strip()) for m in pattern.finditer(md_text)]
 
+def find_heading_chain(md_text, target):
+    """Return the titles from the top-level ancestor down to the target heading.
 
-def find_parent_chain(headings, target):
-    """Given a list of (level, title) and a target title, return its parent chain.
-    
-    Returns empty list if heading exists but has no parents, None if not found.
+    Scans the headings in a single pass and stops at the first match,
+    without building the full heading list. Returns None if not found.
     """
 
     stack = []
-    for level, title in headings:
+    for m in HEADING_REGEX.finditer(md_text):
+        level = len(m.group(1))
+        title = m.group(2).strip()
         while stack and stack[-1][0] >= level:
             stack.pop()
         stack.append((level, title))
         if title == target:
-            # return all parent titles except the target itself
-            return [t for _, t in stack[:-1]]
+            return [t for _, t in stack]
     return None
 
 
@@ -58,13 +65,11 @@ def nail_heading(path: Path, heading: str):
     """Return a structured heading chain."""
 
     md_text = path.read_text(encoding="utf-8")
-    headings = parse_headings(md_text)
 
-    chain = find_parent_chain(headings, heading)
+    chain = find_heading_chain(md_text, heading)
     if chain is None:
         return "Heading not found!"
 
-    chain.append(heading)
     return "::".join(chain)
 
 
@@ -135,7 +140,7 @@ if __name__ == "__main__":
     headings = parse_headings(md_text)
     print(headings)
     for lvl, title in headings:
-        print(f"{lvl} {title}")
+        print(f"{'#' * lvl} {title}")
 
     md_heading = sys.argv[2] if len(sys.argv) > 2 else 'Test'
 
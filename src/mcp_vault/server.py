@@ -24,9 +24,12 @@ tools_dict: dict[str, ToolHandler] = {}
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools."""
+    """List available tools.
 
-    return [handler.get_tool_description() for handler in tools_dict.values()]
+    Each handler builds its Tool description once and reuses it.
+    """
+
+    return [handler.tool_description() for handler in tools_dict.values()]
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -26,7 +26,9 @@ from .filters import Filter
 from .executor import read_vault_tasks, execute_query
 
 
-def query(vault_path: Path, query_source: str) -> List[Task]:
+def query(vault_path: Path, query_source: str,
+          exclude_prefixes: tuple[str, ...] = (),
+          parallel: bool = False) -> List[Task]:
     """Execute a query against all tasks in the vault.
 
     This is the main entry point for the tasks module. It reads all tasks
@@ -35,6 +37,9 @@ def query(vault_path: Path, query_source: str) -> List[Task]:
     Args:
         vault_path: Path to the Obsidian vault root directory
         query_source: Query string (multi-line, one filter per line)
+        exclude_prefixes: Skip files whose vault-relative path starts with
+            any of these prefixes
+        parallel: If True, parse vault files in a process pool
 
     Returns:
         List of Task objects matching the query
@@ -45,7 +50,8 @@ def query(vault_path: Path, query_source: str) -> List[Task]:
     Example:
         results = query(Path("/vault"), "not done\\nhappens today")
     """
-    tasks = read_vault_tasks(vault_path)
+    tasks = read_vault_tasks(vault_path, exclude_prefixes=exclude_prefixes,
+                             parallel=parallel)
     return execute_query(tasks, query_source)
 
 
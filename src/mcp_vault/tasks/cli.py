@@ -4,10 +4,32 @@ import sys
 import os
 import json
 import argparse
+from operator import attrgetter
 from pathlib import Path
 from datetime import date
 from . import query
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the standard library encoder
+    orjson = None
+
+
+# Status character to human-readable mapping
+STATUS_MAP = {
+    ' ': 'Open',
+    '/': 'In Progress',
+    'x': 'Done',
+    '-': 'Cancelled',
+}
+
+# Date fields in output order, paired with a getter for the Task attribute
+DATE_FIELDS = tuple(
+    (field_name, attrgetter(field_name))
+    for field_name in ('start_date', 'scheduled_date', 'due_date', 'done_date', 'created_date')
+)
+
 
 def task_to_dict(task, full=False):
     """Convert Task object to JSON-serializable dict.
@@ -16,16 +38,10 @@ def task_to_dict(task, full=False):
         task: Task object to convert
         full: If True, include all fields even if null. If False, hide null dates.
     """
-    # Status character to human-readable mapping
-    STATUS_MAP = {
-        ' ': 'Open',
-        '/': 'In Progress',
-        'x': 'Done',
-        '-': 'Cancelled',
-    }
-
     # Convert status character to human-readable string
-    status_str = STATUS_MAP.get(task.status, f'Custom ({task.status})')
+    status_str = STATUS_MAP.get(task.status)
+    if status_str is None:
+        status_str = f'Custom ({task.status})'
 
     # Convert priority
     if task.priority is None:
@@ -43,22 +59,52 @@ def task_to_dict(task, full=False):
     }
 
     # Add date fields (conditionally include nulls)
-    date_fields = [
-        ('start_date', task.start_date),
-        ('scheduled_date', task.scheduled_date),
-        ('due_date', task.due_date),
-        ('done_date', task.done_date),
-        ('created_date', task.created_date),
-    ]
-
-    for field_name, field_value in date_fields:
+    for field_name, get_field in DATE_FIELDS:
+        field_value = get_field(task)
         if full or field_value is not None:
             result[field_name] = field_value.isoformat() if field_value else None
 
     return result
 
 
-def main():
+def write_json(output, indent=True):
+    """Write output to stdout as JSON.
+
+    Uses orjson when it is installed, which is much faster than the
+    standard library encoder for large indented result sets. The fallback
+    is configured to produce the same bytes, so output doesn't depend on
+    which encoder is available.
+
+    Args:
+        output: JSON-serializable object to write
+        indent: If True, indent with two spaces
+    """
+    if orjson is None:
+        text = json.dumps(
+            output,
+            indent=2 if indent else None,
+            separators=None if indent else (',', ':'),
+            ensure_ascii=False,
+        )
+        data = (text + '\n').encode()
+    else:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(output, option=option)
+
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        return
+
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def main(argv=None):
     """Main entry point for mcp-vault-query CLI.
 
     Usage:
@@ -68,6 +114,12 @@ def main():
         mcp-vault-query --filter .claude,archived "not done"
         mcp-vault-query "happens today" /path/to/vault
         echo "not done" | mcp-vault-query
+
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
     """
     # Create argument parser
     parser = argparse.ArgumentParser(
@@ -94,6 +146,12 @@ def main():
         help='Include all fields in JSON output, even if null'
     )
 
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Parse vault files in parallel across CPU cores (worth it only for very large vaults)'
+    )
+
     parser.add_argument(
         'query',
         nargs='?',
@@ -109,7 +167,7 @@ def main():
     )
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Determine query source
     query_source = args.query
@@ -147,7 +205,9 @@ def main():
 
     # Execute query
     try:
-        results = query(vault_path, query_source)
+        # Excluded paths are skipped while walking the vault
+        results = query(vault_path, query_source, exclude_prefixes=tuple(filter_paths),
+                        parallel=args.parallel)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -155,19 +215,12 @@ def main():
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
 
-    # Apply path filters if specified
-    if filter_paths:
-        results = [
-            task for task in results
-            if not any(task.file_path.startswith(filter_path) for filter_path in filter_paths)
-        ]
-
     # Format and print results
     if not results:
         if args.raw:
             print("No tasks found matching query.", file=sys.stderr)
         else:
-            print(json.dumps({"tasks": [], "count": 0}))
+            write_json({"tasks": [], "count": 0}, indent=False)
         return 0
 
     if args.raw:
@@ -199,7 +252,7 @@ def main():
             "tasks": [task_to_dict(task, full=args.full) for task in results],
             "count": len(results)
         }
-        print(json.dumps(output, indent=2))
+        write_json(output)
 
     return 0
 
@@ -1,49 +1,182 @@
 """Executor for reading vault tasks and applying query filters."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from .models import Task
+from .filters import compile_predicate
 from .parser import parse_task_line
 from .query_parser import parse_query
 
 
-def read_vault_tasks(vault_path: Path, filter_invalid: bool = True) -> List[Task]:
+# Number of files handed to a worker process per IPC round-trip
+PARALLEL_CHUNKSIZE = 32
+
+# Upper bound on worker processes when parsing in parallel
+PARALLEL_MAX_WORKERS = os.cpu_count() or 1
+
+# ASCII bytes TASK_REGEX accepts as indentation before the list marker
+_INDENT_BYTES = b' \t>\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# First byte of a bullet ('-', '*', '+') or ordered ('1.', '1)') list marker
+_LIST_MARKER_BYTES = frozenset(b'-*+0123456789')
+
+
+def read_vault_tasks(vault_path: Path, filter_invalid: bool = True,
+                     exclude_prefixes: tuple[str, ...] = (),
+                     parallel: bool = False) -> List[Task]:
     """Read all tasks from markdown files in the vault.
 
+    Files are parsed serially unless parallel is set.
+
     Args:
         vault_path: Path to the vault root directory
         filter_invalid: If True, filter out tasks with empty descriptions
+        exclude_prefixes: Skip files whose path relative to the vault root
+            starts with any of these prefixes (never opened or parsed)
+        parallel: If True, parse files across CPU cores in a process pool.
+            Pool startup costs ~50ms while serial parsing costs ~0.15ms
+            per file, so this only pays off for very large vaults
 
     Returns:
         List of Task objects found in the vault
     """
+    # Recursively find all markdown files
+    jobs = [
+        (md_path, relative_path, filter_invalid)
+        for md_path, relative_path in _walk_markdown_files(str(vault_path), exclude_prefixes)
+    ]
+
     tasks = []
+    for file_tasks in _parse_files(jobs, parallel):
+        tasks.extend(file_tasks)
 
-    # Recursively find all markdown files
-    for md_file in vault_path.rglob("*.md"):
-        # Get relative path from vault root
+    return tasks
+
+
+def _walk_markdown_files(root: str, exclude_prefixes: tuple[str, ...] = ()
+                         ) -> Iterator[tuple[str, str]]:
+    """Recursively yield markdown files under root using os.scandir.
+
+    Equivalent to Path.rglob("*.md") (symlinked directories are not
+    followed, unreadable directories are skipped) without building a Path
+    object or matching a glob pattern for every directory entry.
+
+    Args:
+        root: Path to the vault root directory
+        exclude_prefixes: Relative path prefixes to skip; directories whose
+            whole subtree is excluded are not descended into
+
+    Yields:
+        Tuples of (absolute_path, relative_path)
+    """
+    prefix_len = len(os.path.join(root, ''))
+    stack = [root]
+
+    while stack:
+        directory = stack.pop()
         try:
-            relative_path = str(md_file.relative_to(vault_path))
-        except ValueError:
-            # File not under vault_path (shouldn't happen with rglob)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        relative_path = entry.path[prefix_len:]
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (relative_path + os.sep).startswith(exclude_prefixes):
+                                stack.append(entry.path)
+                        elif entry.name.endswith('.md'):
+                            if not relative_path.startswith(exclude_prefixes):
+                                yield entry.path, relative_path
+                    except OSError:
+                        # Broken symlink or entry removed mid-walk
+                        continue
+        except OSError:
             continue
 
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, start=1):
-                    task = parse_task_line(
-                        line.rstrip('\n\r'),
-                        file_path=relative_path,
-                        line_number=line_num
-                    )
-                    if task is not None:
-                        # Optionally filter out invalid tasks
-                        if not filter_invalid or task.is_valid():
-                            tasks.append(task)
-        except (IOError, OSError) as e:
-            # Skip files that can't be read
+
+def _parse_files(jobs: List[tuple[str, str, bool]], parallel: bool = False) -> List[List[Task]]:
+    """Parse a batch of files, optionally in a process pool.
+
+    Args:
+        jobs: List of (absolute_path, relative_path, filter_invalid) tuples
+        parallel: If True, spread the files across worker processes
+
+    Returns:
+        One task list per job, in the same order as jobs
+    """
+    # No more workers than there are chunks to hand out; with a single
+    # worker the process pool would only add startup and pickling cost
+    chunks = -(-len(jobs) // PARALLEL_CHUNKSIZE)
+    workers = min(PARALLEL_MAX_WORKERS, chunks)
+    if not parallel or workers < 2:
+        return [_parse_file(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_file, jobs, chunksize=PARALLEL_CHUNKSIZE))
+
+
+def _parse_file(job: tuple[str, str, bool]) -> List[Task]:
+    """Parse all tasks from a single markdown file.
+
+    Module-level so it can be pickled and run in a worker process.
+
+    Args:
+        job: Tuple of (absolute_path, relative_path, filter_invalid)
+
+    Returns:
+        List of Task objects found in the file (empty if unreadable)
+    """
+    md_path, relative_path, filter_invalid = job
+    tasks = []
+
+    try:
+        with open(md_path, 'rb') as f:
+            data = f.read()
+    except (IOError, OSError):
+        # Skip files that can't be read
+        return tasks
+
+    # Every task line contains a checkbox bracket; most notes contain none,
+    # so a single C-level substring test skips them before any line work.
+    if b'[' not in data:
+        return tasks
+
+    # Normalize line endings the way text-mode open() would
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+    # Jump between checkbox brackets with C-level bytes searches instead of
+    # splitting every line; only lines that could start with a list item
+    # are sliced out and decoded.
+    line_num = 1
+    counted = 0
+    bracket = data.find(b'[')
+    while bracket != -1:
+        start = data.rfind(b'\n', 0, bracket) + 1
+        end = data.find(b'\n', bracket)
+        if end == -1:
+            end = len(data)
+        bracket = data.find(b'[', end)
+
+        line_num += data.count(b'\n', counted, start)
+        counted = start
+
+        raw_line = data[start:end]
+        first = raw_line.lstrip(_INDENT_BYTES)[0]
+        # Non-ASCII lead bytes may be Unicode indentation; let the parser decide
+        if first < 0x80 and first not in _LIST_MARKER_BYTES:
             continue
 
+        task = parse_task_line(
+            raw_line.decode('utf-8'),
+            file_path=relative_path,
+            line_number=line_num
+        )
+        if task is not None:
+            # Optionally filter out invalid tasks
+            if not filter_invalid or task.is_valid():
+                tasks.append(task)
+
     return tasks
 
 
@@ -64,12 +197,15 @@ def execute_query(tasks: List[Task], query_source: str) -> List[Task]:
     if query.error is not None:
         raise ValueError(f"Query parse error: {query.error}")
 
-    # Apply filters sequentially
+    # Apply the filters
     return apply_filters(tasks, query.filters)
 
 
 def apply_filters(tasks: List[Task], filters: List) -> List[Task]:
-    """Apply a list of filters to tasks sequentially.
+    """Apply a list of filters to tasks in a single pass.
+
+    Filters are fused into one generated predicate and evaluated
+    cheapest first.
 
     Args:
         tasks: List of tasks to filter
@@ -78,9 +214,11 @@ def apply_filters(tasks: List[Task], filters: List) -> List[Task]:
     Returns:
         Filtered list of tasks
     """
-    result = tasks
-
-    for filter_obj in filters:
-        result = [task for task in result if filter_obj.matches(task)]
-
-    return result
+    if not filters:
+        return list(tasks)
+
+    # Cheapest and most selective filters first; the fused predicate
+    # short-circuits, so later filters only see tasks that passed earlier ones
+    ordered = sorted(filters, key=lambda f: (f.COST, f.SELECTIVITY_HINT))
+    predicate = compile_predicate(ordered)
+    return [task for task in tasks if predicate(task)]
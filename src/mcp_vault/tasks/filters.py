@@ -1,13 +1,96 @@
 """Filter implementations for task querying."""
 
 from datetime import date
-from typing import Optional
+from typing import Callable
 from .models import Task, PRIORITY_HIERARCHY
-from .date_resolver import date_compare
+
+
+# Date operators, mapped to small ints once per filter instead of
+# comparing operator strings on every match
+_OP_BEFORE, _OP_AFTER, _OP_ON = 0, 1, 2
+_DATE_OPERATOR_CODES = {
+    'before': _OP_BEFORE,
+    'after': _OP_AFTER,
+    'on': _OP_ON,
+}
+
+# Priority comparisons, mapped the same way
+_CMP_IS, _CMP_IS_NOT, _CMP_ABOVE, _CMP_BELOW = 0, 1, 2, 3
+_PRIORITY_COMPARISON_CODES = {
+    'is': _CMP_IS,
+    'is_not': _CMP_IS_NOT,
+    'above': _CMP_ABOVE,
+    'below': _CMP_BELOW,
+}
+
+# Python comparison operators for the date operators filters accept
+_DATE_OPERATORS = {
+    'before': '<',
+    'after': '>',
+    'on': '==',
+}
+
+# Query date field names to Task attributes, resolved once per filter.
+# Note: 'created' and 'cancelled' are accepted by HasFilter but not in MVP,
+# so they have no attribute here and never have a date.
+_DATE_FILTER_ATTRS = {
+    'due': 'due_date',
+    'scheduled': 'scheduled_date',
+    'start': 'start_date',
+    'done': 'done_date',
+}
+
+
+def _bind(env: dict, value) -> str:
+    """Store a constant in a compile() environment and return its name."""
+    name = f'_c{len(env)}'
+    env[name] = value
+    return name
+
+
+# Task date attributes a 'happens' filter checks
+_HAPPENS_ATTRS = ('start_date', 'scheduled_date', 'due_date')
+
+
+def _compile_date_compare(attr: str, operator: str, target: str) -> str:
+    """Build an expression equivalent to date_compare on a task attribute."""
+    op = _DATE_OPERATORS.get(operator.lower())
+    if op is None:
+        return 'False'
+    return f'(t.{attr} is not None and t.{attr} {op} {target})'
+
+
+def compile_predicate(filters: list['Filter']) -> Callable[[Task], bool]:
+    """Fuse filters into a single generated function.
+
+    The function is equivalent to all(f.matches(task) for f in filters),
+    evaluated in list order, but avoids a method call per filter per task.
+
+    Args:
+        filters: List of filters to combine with AND logic
+
+    Returns:
+        Function taking a Task and returning True if all filters match
+    """
+    env = {}
+    expr = ' and '.join(f.compile(env) for f in filters) or 'True'
+    return eval(compile(f'lambda t: {expr}', '<filter>', 'eval'), env)
 
 
 class Filter:
-    """Base class for all filters."""
+    """Base class for all filters.
+
+    COST and SELECTIVITY_HINT guide the order in which apply_filters
+    evaluates filters: cheap filters run first, and among equally cheap
+    filters the one expected to keep the fewest tasks (lowest hint) wins.
+    """
+
+    # Relative per-task evaluation cost
+    COST = 1.0
+    # Estimated fraction of tasks that pass the filter
+    SELECTIVITY_HINT = 1.0
+
+    __slots__ = ()
 
     def matches(self, task: Task) -> bool:
         """Check if task matches this filter.
@@ -20,10 +103,30 @@ class Filter:
         """
         raise NotImplementedError
 
+    def compile(self, env: dict) -> str:
+        """Return a Python expression over task `t` equivalent to matches().
+
+        Constants the expression refers to are stored in env. Subclasses
+        override this with inlined field access; the default delegates to
+        matches() so any filter can be compiled.
+
+        Args:
+            env: Globals for the generated function, filled in as needed
+
+        Returns:
+            Python expression source
+        """
+        return f'{_bind(env, self)}.matches(t)'
+
 
 class StatusFilter(Filter):
     """Filter tasks by done/not done status."""
 
+    COST = 1.0
+    SELECTIVITY_HINT = 0.5
+
+    __slots__ = ('value',)
+
     def __init__(self, value: str):
         """Initialize status filter.
 
@@ -39,10 +142,22 @@ class StatusFilter(Filter):
             return not task.is_done
         return False
 
+    def compile(self, env: dict) -> str:
+        if self.value == 'done':
+            return "t.status == 'x'"
+        elif self.value == 'not_done':
+            return "t.status != 'x'"
+        return 'False'
+
 
 class DateFilter(Filter):
     """Filter tasks by date fields with operators."""
 
+    COST = 2.0
+    SELECTIVITY_HINT = 0.3
+
+    __slots__ = ('field', 'operator', 'target_date', '_attr', '_op')
+
     def __init__(self, field: str, operator: str, target_date: date):
         """Initialize date filter.
 
@@ -54,26 +169,40 @@ class DateFilter(Filter):
         self.field = field
         self.operator = operator
         self.target_date = target_date
+        self._attr = _DATE_FILTER_ATTRS.get(field)
+        self._op = _DATE_OPERATOR_CODES.get(operator.lower())
 
     def matches(self, task: Task) -> bool:
         # Get the appropriate date field from the task
-        task_date = self._get_task_date(task)
-        return date_compare(task_date, self.operator, self.target_date)
+        task_date = getattr(task, self._attr) if self._attr else None
+        if task_date is None:
+            return False
+
+        op = self._op
+        if op == _OP_BEFORE:
+            return task_date < self.target_date
+        elif op == _OP_AFTER:
+            return task_date > self.target_date
+        elif op == _OP_ON:
+            return task_date == self.target_date
+
+        # Unknown operator
+        return False
 
-    def _get_task_date(self, task: Task) -> Optional[date]:
-        """Extract the relevant date field from task."""
-        field_map = {
-            'due': task.due_date,
-            'scheduled': task.scheduled_date,
-            'start': task.start_date,
-            'done': task.done_date,
-        }
-        return field_map.get(self.field)
+    def compile(self, env: dict) -> str:
+        if self._attr is None:
+            return 'False'
+        return _compile_date_compare(self._attr, self.operator, _bind(env, self.target_date))
 
 
 class HappensFilter(Filter):
     """Filter tasks by 'happens' date (earliest of start, scheduled, due)."""
 
+    COST = 4.0
+    SELECTIVITY_HINT = 0.8
+
+    __slots__ = ('operator', 'target_date', '_op')
+
     def __init__(self, operator: str, target_date: date):
         """Initialize happens filter.
 
@@ -81,28 +210,47 @@ class HappensFilter(Filter):
             operator: Comparison operator ('before', 'after', 'on')
             target_date: Date to compare against
         """
-        self.operator = operator
+        self.operator = operator.lower()
         self.target_date = target_date
+        self._op = _DATE_OPERATOR_CODES.get(self.operator)
 
     def matches(self, task: Task) -> bool:
         # Check if ANY of the three date fields matches the condition
-        dates_to_check = [
-            task.start_date,
-            task.scheduled_date,
-            task.due_date,
-        ]
-
-        for task_date in dates_to_check:
-            if task_date is not None:
-                if date_compare(task_date, self.operator, self.target_date):
-                    return True
+        start, scheduled, due = task.start_date, task.scheduled_date, task.due_date
+        target = self.target_date
+        op = self._op
+        if op == _OP_BEFORE:
+            return ((start is not None and start < target)
+                    or (scheduled is not None and scheduled < target)
+                    or (due is not None and due < target))
+        elif op == _OP_AFTER:
+            return ((start is not None and start > target)
+                    or (scheduled is not None and scheduled > target)
+                    or (due is not None and due > target))
+        elif op == _OP_ON:
+            return target in (start, scheduled, due)
 
         return False
 
+    def compile(self, env: dict) -> str:
+        target = _bind(env, self.target_date)
+        if self._op in (_OP_BEFORE, _OP_AFTER):
+            return '(' + ' or '.join(
+                _compile_date_compare(attr, self.operator, target) for attr in _HAPPENS_ATTRS
+            ) + ')'
+        elif self._op == _OP_ON:
+            return f'{target} in (t.start_date, t.scheduled_date, t.due_date)'
+        return 'False'
+
 
 class PriorityFilter(Filter):
     """Filter tasks by priority level."""
 
+    COST = 1.5
+    SELECTIVITY_HINT = 0.3
+
+    __slots__ = ('comparison', 'target_priority', '_cmp', '_target_level')
+
     def __init__(self, comparison: str, target_priority: str):
         """Initialize priority filter.
 
@@ -112,29 +260,47 @@ class PriorityFilter(Filter):
         """
         self.comparison = comparison
         self.target_priority = target_priority
+        self._cmp = _PRIORITY_COMPARISON_CODES.get(comparison)
+        self._target_level = PRIORITY_HIERARCHY.get(target_priority, 3)
 
     def matches(self, task: Task) -> bool:
         task_priority = task.priority or 'none'
-        task_level = PRIORITY_HIERARCHY.get(task_priority, 3)
-        target_level = PRIORITY_HIERARCHY.get(self.target_priority, 3)
 
-        if self.comparison == 'is':
+        cmp = self._cmp
+        if cmp == _CMP_IS:
             return task_priority == self.target_priority
-        elif self.comparison == 'is_not':
+        elif cmp == _CMP_IS_NOT:
             return task_priority != self.target_priority
-        elif self.comparison == 'above':
+        elif cmp == _CMP_ABOVE:
             # Lower number = higher priority, so "above medium" means level < medium's level
-            return task_level < target_level
-        elif self.comparison == 'below':
+            return PRIORITY_HIERARCHY.get(task_priority, 3) < self._target_level
+        elif cmp == _CMP_BELOW:
             # Higher number = lower priority, so "below medium" means level > medium's level
-            return task_level > target_level
+            return PRIORITY_HIERARCHY.get(task_priority, 3) > self._target_level
 
         return False
 
+    def compile(self, env: dict) -> str:
+        task_priority = "(t.priority or 'none')"
+        if self._cmp == _CMP_IS:
+            return f'{task_priority} == {_bind(env, self.target_priority)}'
+        elif self._cmp == _CMP_IS_NOT:
+            return f'{task_priority} != {_bind(env, self.target_priority)}'
+        elif self._cmp in (_CMP_ABOVE, _CMP_BELOW):
+            hierarchy = _bind(env, PRIORITY_HIERARCHY)
+            op = '<' if self._cmp == _CMP_ABOVE else '>'
+            return f'{hierarchy}.get({task_priority}, 3) {op} {self._target_level}'
+        return 'False'
+
 
 class HasFilter(Filter):
     """Filter tasks by presence/absence of date fields."""
 
+    COST = 1.0
+    SELECTIVITY_HINT = 0.5
+
+    __slots__ = ('field', 'has', '_attr')
+
     def __init__(self, field: str, has: bool):
         """Initialize has/no filter.
 
@@ -144,65 +310,96 @@ class HasFilter(Filter):
         """
         self.field = field
         self.has = has
+        self._attr = _DATE_FILTER_ATTRS.get(field)
 
     def matches(self, task: Task) -> bool:
         # Get the appropriate date field from the task
-        task_date = self._get_task_date(task)
+        task_date = getattr(task, self._attr) if self._attr else None
 
         if self.has:
             return task_date is not None
         else:
             return task_date is None
 
-    def _get_task_date(self, task: Task) -> Optional[date]:
-        """Extract the relevant date field from task."""
-        field_map = {
-            'due': task.due_date,
-            'scheduled': task.scheduled_date,
-            'start': task.start_date,
-            'done': task.done_date,
-            # Note: 'created' and 'cancelled' not in MVP but here for completeness
-            'created': None,
-            'cancelled': None,
-        }
-        return field_map.get(self.field)
+    def compile(self, env: dict) -> str:
+        if self._attr is None:
+            # Fields without a Task attribute never have a date
+            return 'False' if self.has else 'True'
+        return f't.{self._attr} is not None' if self.has else f't.{self._attr} is None'
 
 
 class AndFilter(Filter):
-    """Combine multiple filters with AND logic."""
+    """Combine multiple filters with AND logic.
+
+    Children are evaluated cheapest and most selective first, the same
+    order apply_filters uses, so rejected tasks are dropped early.
+    """
+
+    COST = 5.0
+    SELECTIVITY_HINT = 0.9
+
+    __slots__ = ('filters', '_ordered')
 
     def __init__(self, filters: list[Filter]):
         """Initialize AND filter.
 
         Args:
-            filters: List of filters to combine
+            filters: Filters to combine, stored as a tuple so the
+                evaluation order computed here can't go stale
         """
-        self.filters = filters
+        self.filters = tuple(filters)
+        self._ordered = tuple(sorted(self.filters, key=lambda f: (f.COST, f.SELECTIVITY_HINT)))
 
     def matches(self, task: Task) -> bool:
         # All filters must match
-        return all(f.matches(task) for f in self.filters)
+        return all(f.matches(task) for f in self._ordered)
+
+    def compile(self, env: dict) -> str:
+        if not self._ordered:
+            return 'True'
+        return '(' + ' and '.join(f.compile(env) for f in self._ordered) + ')'
 
 
 class OrFilter(Filter):
-    """Combine multiple filters with OR logic."""
+    """Combine multiple filters with OR logic.
+
+    Children are evaluated cheapest and least selective first, so accepted
+    tasks are settled early.
+    """
+
+    COST = 5.0
+    SELECTIVITY_HINT = 0.9
+
+    __slots__ = ('filters', '_ordered')
 
     def __init__(self, filters: list[Filter]):
         """Initialize OR filter.
 
         Args:
-            filters: List of filters to combine
+            filters: Filters to combine, stored as a tuple so the
+                evaluation order computed here can't go stale
         """
-        self.filters = filters
+        self.filters = tuple(filters)
+        self._ordered = tuple(sorted(self.filters, key=lambda f: (f.COST, -f.SELECTIVITY_HINT)))
 
     def matches(self, task: Task) -> bool:
         # At least one filter must match
-        return any(f.matches(task) for f in self.filters)
+        return any(f.matches(task) for f in self._ordered)
+
+    def compile(self, env: dict) -> str:
+        if not self._ordered:
+            return 'False'
+        return '(' + ' or '.join(f.compile(env) for f in self._ordered) + ')'
 
 
 class NotFilter(Filter):
     """Negate a filter."""
 
+    COST = 5.0
+    SELECTIVITY_HINT = 0.9
+
+    __slots__ = ('filter',)
+
     def __init__(self, filter: Filter):
         """Initialize NOT filter.
 
@@ -213,3 +410,6 @@ class NotFilter(Filter):
 
     def matches(self, task: Task) -> bool:
         return not self.filter.matches(task)
+
+    def compile(self, env: dict) -> str:
+        return f'(not {self.filter.compile(env)})'
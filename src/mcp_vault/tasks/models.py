@@ -6,7 +6,7 @@ from typing import Optional
 import re
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a parsed task from markdown."""
 
@@ -32,7 +32,7 @@ class Task:
         return bool(self.description.strip())
 
 
-@dataclass
+@dataclass(slots=True)
 class Query:
     """Represents a parsed query with filters."""
 
@@ -61,14 +61,41 @@ PRIORITY_EMOJI_MAP = {
 }
 
 # Compiled regex patterns for task parsing
-# Main task pattern: matches checkbox tasks
-TASK_REGEX = re.compile(r'^([\s\t>]*)([-*+]|[0-9]+[.)]) +\[(.)\] *(.*)$')
+# Main task pattern: matches checkbox tasks. The quantifiers are possessive
+# because adjacent parts never overlap, so giving characters back can't
+# produce a match; without that, a long run of spaces before a stray
+# newline backtracked quadratically.
+TASK_REGEX = re.compile(r'^([\s>]*+)([-*+]|[0-9]++[.)]) ++\[(.)\] *+(.*)$')
 
-# Emoji field patterns (applied from end of string)
+# Emoji field patterns
+# Each field starts with a marker emoji. EMOJI_MARKER_REGEX finds candidate
+# positions in one scan, and EMOJI_FIELD_PATTERNS maps each marker to the
+# pattern for its field, matched at that position. The named group
+# identifies the field (priority or a *_date field). Fields only count when
+# they form the trailing run of the content, which the parser checks by
+# walking the matches from the end.
 # \uFE0F? handles optional Variant Selector 16
-PRIORITY_REGEX = re.compile(r'(🔺|⏫|🔼|🔽|⏬)\uFE0F?$')
-DONE_DATE_REGEX = re.compile(r'✅\uFE0F? *(\d{4}-\d{2}-\d{2})$')
-SCHEDULED_DATE_REGEX = re.compile(r'(?:⏳|⌛)\uFE0F? *(\d{4}-\d{2}-\d{2})$')
-DUE_DATE_REGEX = re.compile(r'(?:📅|📆|🗓)\uFE0F? *(\d{4}-\d{2}-\d{2})$')
-START_DATE_REGEX = re.compile(r'🛫\uFE0F? *(\d{4}-\d{2}-\d{2})$')
-CREATED_DATE_REGEX = re.compile(r'➕\uFE0F? *(\d{4}-\d{2}-\d{2})$')
+EMOJI_MARKER_REGEX = re.compile(r'[🔺⏫🔼🔽⏬✅⏳⌛📅📆🗓🛫➕]')
+
+_PRIORITY_FIELD_REGEX = re.compile(r'(?P<priority>🔺|⏫|🔼|🔽|⏬)\uFE0F?')
+_DONE_DATE_FIELD_REGEX = re.compile(r'✅\uFE0F? *(?P<done_date>\d{4}-\d{2}-\d{2})')
+_SCHEDULED_DATE_FIELD_REGEX = re.compile(r'(?:⏳|⌛)\uFE0F? *(?P<scheduled_date>\d{4}-\d{2}-\d{2})')
+_DUE_DATE_FIELD_REGEX = re.compile(r'(?:📅|📆|🗓)\uFE0F? *(?P<due_date>\d{4}-\d{2}-\d{2})')
+_START_DATE_FIELD_REGEX = re.compile(r'🛫\uFE0F? *(?P<start_date>\d{4}-\d{2}-\d{2})')
+_CREATED_DATE_FIELD_REGEX = re.compile(r'➕\uFE0F? *(?P<created_date>\d{4}-\d{2}-\d{2})')
+
+EMOJI_FIELD_PATTERNS = {
+    '🔺': _PRIORITY_FIELD_REGEX,
+    '⏫': _PRIORITY_FIELD_REGEX,
+    '🔼': _PRIORITY_FIELD_REGEX,
+    '🔽': _PRIORITY_FIELD_REGEX,
+    '⏬': _PRIORITY_FIELD_REGEX,
+    '✅': _DONE_DATE_FIELD_REGEX,
+    '⏳': _SCHEDULED_DATE_FIELD_REGEX,
+    '⌛': _SCHEDULED_DATE_FIELD_REGEX,
+    '📅': _DUE_DATE_FIELD_REGEX,
+    '📆': _DUE_DATE_FIELD_REGEX,
+    '🗓': _DUE_DATE_FIELD_REGEX,
+    '🛫': _START_DATE_FIELD_REGEX,
+    '➕': _CREATED_DATE_FIELD_REGEX,
+}
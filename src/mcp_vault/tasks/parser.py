@@ -1,17 +1,14 @@
 """Task markdown parsing with emoji field extraction."""
 
+import functools
 from datetime import date
 from typing import Optional
 from .models import (
     Task,
     TASK_REGEX,
-    PRIORITY_REGEX,
+    EMOJI_MARKER_REGEX,
+    EMOJI_FIELD_PATTERNS,
     PRIORITY_EMOJI_MAP,
-    DONE_DATE_REGEX,
-    SCHEDULED_DATE_REGEX,
-    DUE_DATE_REGEX,
-    START_DATE_REGEX,
-    CREATED_DATE_REGEX,
 )
 
 
@@ -26,16 +23,23 @@ def parse_task_line(line: str, file_path: str = "", line_number: int = 0) -> Opt
     Returns:
         Task object if line is a valid task, None otherwise
     """
-    # Match the main task pattern
-    match = TASK_REGEX.match(line)
-    if not match:
+    # Scan the common checkbox shape by hand, deferring to the full regex
+    # only for unusual lines (e.g. exotic Unicode indentation)
+    scanned = _scan_task_prefix(line)
+    if scanned is _NOT_A_TASK:
         return None
 
-    # Extract components
-    # indentation = match.group(1)  # Not needed for now
-    # list_marker = match.group(2)  # Not needed for now
-    status_char = match.group(3)
-    content = match.group(4)
+    if scanned is None:
+        match = TASK_REGEX.match(line)
+        if not match:
+            return None
+
+        # indentation = match.group(1)  # Not needed for now
+        # list_marker = match.group(2)  # Not needed for now
+        status_char = match.group(3)
+        content = match.group(4)
+    else:
+        status_char, content = scanned
 
     # Reject invalid status characters (e.g., '[' or ']' from wiki links)
     # Valid status characters are typically: space, x, /, -, letters, etc.
@@ -43,30 +47,106 @@ def parse_task_line(line: str, file_path: str = "", line_number: int = 0) -> Opt
     if status_char in ['[', ']']:
         return None
 
-    # Extract emoji fields from the content
+    # Extract emoji fields from the content; the description comes back
+    # already stripped
     fields, description = extract_emoji_fields(content)
 
     # Build the Task object
     return Task(
         status=status_char,
-        description=description.strip(),
-        priority=fields.get('priority'),
-        start_date=fields.get('start_date'),
-        scheduled_date=fields.get('scheduled_date'),
-        due_date=fields.get('due_date'),
-        done_date=fields.get('done_date'),
-        created_date=fields.get('created_date'),
+        description=description,
         source_line=line,
         file_path=file_path,
         line_number=line_number,
+        **fields,
     )
 
 
+# Emoji fields with nothing extracted; keys match the Task field names.
+# Copying this is cheaper than building the dict literal for every line.
+_EMPTY_FIELDS = {
+    'priority': None,
+    'done_date': None,
+    'scheduled_date': None,
+    'due_date': None,
+    'start_date': None,
+    'created_date': None,
+}
+
+# Translation table that deletes Variant Selector 16
+_STRIP_VS16 = str.maketrans('', '', '\uFE0F')
+
+# Sentinel returned by _scan_task_prefix for lines that cannot be tasks
+_NOT_A_TASK = object()
+
+_LIST_BULLETS = '-*+'
+_ORDERED_DIGITS = '0123456789'
+_ORDERED_DELIMITERS = '.)'
+
+
+def _scan_task_prefix(line: str):
+    """Match TASK_REGEX's checkbox prefix without invoking the regex engine.
+
+    Args:
+        line: A markdown line that may contain a task
+
+    Returns:
+        (status_char, content) if the line is a task, _NOT_A_TASK if it
+        definitely is not, or None if the line needs the full TASK_REGEX
+    """
+    n = len(line)
+    i = 0
+
+    # Indentation and blockquote markers
+    while i < n and line[i] in ' \t>':
+        i += 1
+    if i == n:
+        return _NOT_A_TASK
+
+    # List marker: bullet or ordered "1." / "1)"
+    char = line[i]
+    if char in _LIST_BULLETS:
+        i += 1
+    elif char in _ORDERED_DIGITS:
+        i += 1
+        while i < n and line[i] in _ORDERED_DIGITS:
+            i += 1
+        if i == n or line[i] not in _ORDERED_DELIMITERS:
+            return _NOT_A_TASK
+        i += 1
+    elif char.isspace():
+        # Other whitespace is valid indentation for TASK_REGEX
+        return None
+    else:
+        return _NOT_A_TASK
+
+    # At least one space before the checkbox
+    if i == n or line[i] != ' ':
+        return _NOT_A_TASK
+    while i < n and line[i] == ' ':
+        i += 1
+
+    # Checkbox: "[" status "]"
+    if i + 2 >= n or line[i] != '[' or line[i + 2] != ']':
+        return _NOT_A_TASK
+    status_char = line[i + 1]
+    i += 3
+
+    while i < n and line[i] == ' ':
+        i += 1
+    content = line[i:]
+
+    if status_char == '\n' or '\n' in content:
+        # Newline handling differs subtly; let the regex decide
+        return None
+
+    return status_char, content
+
+
 def extract_emoji_fields(content: str) -> tuple[dict, str]:
     """Extract emoji fields from task content.
 
-    Fields are removed from the end of the string in a specific order.
-    Loop up to 20 times to catch all fields.
+    Fields are removed from the end of the string, up to 20 of them.
 
     Args:
         content: The task content after the checkbox
@@ -74,84 +154,44 @@ def extract_emoji_fields(content: str) -> tuple[dict, str]:
     Returns:
         Tuple of (extracted_fields_dict, remaining_description)
     """
-    fields = {
-        'priority': None,
-        'done_date': None,
-        'scheduled_date': None,
-        'due_date': None,
-        'start_date': None,
-        'created_date': None,
-    }
+    fields = _EMPTY_FIELDS.copy()
 
     remaining = content.strip()
 
-    # Loop up to 20 times to extract all fields
-    # (matching the plugin's behavior)
-    for _ in range(20):
-        if not remaining:
+    # Every field marker is a non-ASCII emoji, and str.isascii() is a
+    # constant-time flag check, so plain-text tasks skip the regex entirely
+    if remaining.isascii():
+        return fields, remaining
+
+    # One scan finds every marker emoji; the marker selects the single
+    # field pattern to match at that offset
+    matches = [
+        match
+        for marker in EMOJI_MARKER_REGEX.finditer(remaining)
+        if (match := EMOJI_FIELD_PATTERNS[marker[0]].match(remaining, marker.start())) is not None
+    ]
+
+    # Walk the fields from the end and stop at the first one that isn't
+    # part of the trailing run. At most 20 fields are extracted
+    # (matching the plugin's behavior).
+    end = len(remaining)
+    for match in reversed(matches[-20:]):
+        start, stop = match.span()
+
+        # Only whitespace may separate this field from the one after it
+        if stop != end and not remaining[stop:end].isspace():
             break
 
-        # Try each pattern in order
-        found = False
-
-        # Priority emoji (must come first as it has no date)
-        match = PRIORITY_REGEX.search(remaining)
-        if match and fields['priority'] is None:
-            emoji = match.group(1)
-            fields['priority'] = priority_emoji_to_name(emoji)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # Done date
-        match = DONE_DATE_REGEX.search(remaining)
-        if match and fields['done_date'] is None:
-            date_str = match.group(1)
-            fields['done_date'] = parse_date(date_str)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # Scheduled date
-        match = SCHEDULED_DATE_REGEX.search(remaining)
-        if match and fields['scheduled_date'] is None:
-            date_str = match.group(1)
-            fields['scheduled_date'] = parse_date(date_str)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # Due date
-        match = DUE_DATE_REGEX.search(remaining)
-        if match and fields['due_date'] is None:
-            date_str = match.group(1)
-            fields['due_date'] = parse_date(date_str)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # Start date
-        match = START_DATE_REGEX.search(remaining)
-        if match and fields['start_date'] is None:
-            date_str = match.group(1)
-            fields['start_date'] = parse_date(date_str)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # Created date
-        match = CREATED_DATE_REGEX.search(remaining)
-        if match and fields['created_date'] is None:
-            date_str = match.group(1)
-            fields['created_date'] = parse_date(date_str)
-            remaining = remaining[:match.start()].strip()
-            found = True
-            continue
-
-        # If no field was found, break the loop
-        if not found:
+        # A repeated field ends extraction; it stays in the description
+        field = match.lastgroup
+        if fields[field] is not None:
             break
 
+        fields[field] = _FIELD_CONVERTERS[field](match[field])
+        end = start
+
+    remaining = remaining[:end].rstrip()
+
     return fields, remaining
 
 
@@ -164,9 +204,12 @@ def priority_emoji_to_name(emoji: str) -> str:
     Returns:
         Priority name: 'highest', 'high', 'medium', 'low', 'lowest'
     """
+    name = PRIORITY_EMOJI_MAP.get(emoji)
+    if name is not None:
+        return name
+
     # Remove variant selector if present
-    emoji = emoji.replace('\uFE0F', '')
-    return PRIORITY_EMOJI_MAP.get(emoji, 'none')
+    return PRIORITY_EMOJI_MAP.get(emoji.translate(_STRIP_VS16), 'none')
 
 
 def parse_date(date_str: str) -> Optional[date]:
@@ -178,8 +221,33 @@ def parse_date(date_str: str) -> Optional[date]:
     Returns:
         date object, or None if invalid
     """
+    try:
+        return date.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        pass
+
+    # Slow path for strings fromisoformat rejects but the field regexes
+    # accept, e.g. non-ASCII digits matched by \d
     try:
         year, month, day = date_str.split('-')
         return date(int(year), int(month), int(day))
     except (ValueError, AttributeError):
         return None
+
+
+# Task dates repeat heavily across a vault, so field dates are memoized:
+# a hit skips parse_date's call and error handling, and equal dates share
+# one date object.
+_parse_field_date = functools.lru_cache(maxsize=4096)(parse_date)
+
+# Converter from a matched field's text to its value, keyed by field group name.
+# The priority group only ever captures one of the map's bare emoji (the
+# variant selector is outside the group), so it is looked up directly.
+_FIELD_CONVERTERS = {
+    'priority': PRIORITY_EMOJI_MAP.__getitem__,
+    'done_date': _parse_field_date,
+    'scheduled_date': _parse_field_date,
+    'due_date': _parse_field_date,
+    'start_date': _parse_field_date,
+    'created_date': _parse_field_date,
+}
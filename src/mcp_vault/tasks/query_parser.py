@@ -16,42 +16,36 @@ from .filters import (
 from .date_resolver import resolve_date
 
 
-# Regex patterns for filter recognition
-STATUS_DONE_PATTERN = re.compile(r'^done$', re.IGNORECASE)
-STATUS_NOT_DONE_PATTERN = re.compile(r'^not done$', re.IGNORECASE)
-
-DATE_FILTER_PATTERN = re.compile(
-    r'^(due|scheduled|start|done)\s+(before|after|on)\s+(.+)$',
-    re.IGNORECASE
-)
-
-HAPPENS_FILTER_PATTERN = re.compile(
-    r'^happens\s+(before|after|on)\s+(.+)$',
-    re.IGNORECASE
-)
-
-HAS_FILTER_PATTERN = re.compile(
-    r'^(has|no)\s+(due|scheduled|start|created|done|cancelled)\s+date$',
-    re.IGNORECASE
-)
-
-PRIORITY_FILTER_PATTERN = re.compile(
-    r'^priority\s+is\s+(.+)$',
-    re.IGNORECASE
+# Keywords recognized by the clause parsers (query lines are lowercased)
+DATE_FILTER_FIELDS = frozenset({'due', 'scheduled', 'start', 'done'})
+DATE_OPERATORS = frozenset({'before', 'after', 'on'})
+HAS_FILTER_FIELDS = frozenset({'due', 'scheduled', 'start', 'created', 'done', 'cancelled'})
+
+# Valid priority names in "priority is ..." clauses
+PRIORITY_NAMES = frozenset({'highest', 'high', 'medium', 'low', 'lowest', 'none'})
+
+# Priority clause modifier word to PriorityFilter comparison
+PRIORITY_MODIFIERS = {
+    'not': 'is_not',
+    'above': 'above',
+    'below': 'below',
+}
+
+# Boolean expression: "(<filter>) AND|OR (<filter>)" (simplified for MVP)
+# The left operand is found by paren matching; this pattern matches the
+# operator and right operand that follow it.
+BOOLEAN_OPERATOR_PATTERN = re.compile(
+    r'\s+(and|or)\s+\((.+)\)$'
 )
 
-# Boolean expression pattern (simplified for MVP)
-BOOLEAN_EXPR_PATTERN = re.compile(
-    r'^\((.+)\)\s+(AND|OR)\s+\((.+)\)$',
-    re.IGNORECASE
-)
 
-
-def parse_query(query_source: str) -> Query:
+def parse_query(query_source: str, strict: bool = False) -> Query:
     """Parse a query source string into a Query object.
 
     Args:
         query_source: Multi-line query string
+        strict: Stop at the first unparseable line instead of reporting
+            every one
 
     Returns:
         Query object with parsed filters or error
@@ -65,11 +59,14 @@ def parse_query(query_source: str) -> Query:
         if not line:
             continue
 
-        filter_obj = parse_line(line)
+        # Lowercase once here; the original line is kept for the error message
+        filter_obj = _parse_normalized_line(line.lower())
         if filter_obj is not None:
             filters.append(filter_obj)
         else:
             errors.append(f"Could not parse line: {line}")
+            if strict:
+                break
 
     if errors:
         return Query(filters=[], error="; ".join(errors))
@@ -80,83 +77,195 @@ def parse_query(query_source: str) -> Query:
 def parse_line(line: str) -> Optional[Filter]:
     """Parse a single query line into a Filter object.
 
+    The line is lowercased once up front and split into words. The first
+    word selects the only clause parser that can match it, which checks
+    the remaining words positionally against its keyword sets.
+
     Args:
         line: A single query statement line
 
     Returns:
         Filter object if line is valid, None otherwise
     """
-    line = line.strip()
+    return _parse_normalized_line(line.strip().lower())
+
+
+def _parse_normalized_line(line: str) -> Optional[Filter]:
+    """Parse a query line that is already stripped and lowercased."""
+    if not line:
+        return None
+
+    if line.startswith('('):
+        return _parse_boolean_expr(line)
+
+    handler = _LINE_PARSERS.get(line.split(None, 1)[0])
+    if handler is None:
+        # Could not parse
+        return None
+
+    return handler(line)
 
-    # Try status filters first
-    if STATUS_DONE_PATTERN.match(line):
+
+def _parse_done_line(line: str) -> Optional[Filter]:
+    """Parse a line starting with 'done': status or done-date filter."""
+    if line == 'done':
         return StatusFilter('done')
 
-    if STATUS_NOT_DONE_PATTERN.match(line):
+    return _parse_date_filter(line)
+
+
+def _parse_not_done(line: str) -> Optional[Filter]:
+    """Parse the 'not done' status filter."""
+    if line == 'not done':
         return StatusFilter('not_done')
 
-    # Try date filters
-    match = DATE_FILTER_PATTERN.match(line)
-    if match:
-        field = match.group(1).lower()
-        operator = match.group(2).lower()
-        date_str = match.group(3)
-
-        target_date = resolve_date(date_str)
-        if target_date is None:
-            return None
-
-        return DateFilter(field, operator, target_date)
-
-    # Try happens filter
-    match = HAPPENS_FILTER_PATTERN.match(line)
-    if match:
-        operator = match.group(1).lower()
-        date_str = match.group(2)
-
-        target_date = resolve_date(date_str)
-        if target_date is None:
-            return None
-
-        return HappensFilter(operator, target_date)
-
-    # Try has/no filter
-    match = HAS_FILTER_PATTERN.match(line)
-    if match:
-        has_or_no = match.group(1).lower()
-        field = match.group(2).lower()
-
-        has = (has_or_no == 'has')
-        return HasFilter(field, has)
-
-    # Try priority filter
-    match = PRIORITY_FILTER_PATTERN.match(line)
-    if match:
-        priority_clause = match.group(1).lower().strip()
-        return parse_priority_clause(priority_clause)
-
-    # Try boolean expression (AND/OR)
-    match = BOOLEAN_EXPR_PATTERN.match(line)
-    if match:
-        left_expr = match.group(1).strip()
-        operator = match.group(2).upper()
-        right_expr = match.group(3).strip()
-
-        left_filter = parse_line(left_expr)
-        right_filter = parse_line(right_expr)
-
-        if left_filter is None or right_filter is None:
-            return None
-
-        if operator == 'AND':
-            return AndFilter([left_filter, right_filter])
-        elif operator == 'OR':
-            return OrFilter([left_filter, right_filter])
-
-    # Could not parse
     return None
 
 
+def _parse_date_filter(line: str) -> Optional[Filter]:
+    """Parse a '<field> before|after|on <date>' filter."""
+    words = _split_clause(line, 2)
+    if words is None:
+        return None
+
+    field, operator, date_str = words
+    if field not in DATE_FILTER_FIELDS or operator not in DATE_OPERATORS:
+        return None
+
+    target_date = resolve_date(date_str)
+    if target_date is None:
+        return None
+
+    return DateFilter(field, operator, target_date)
+
+
+def _parse_happens_filter(line: str) -> Optional[Filter]:
+    """Parse a 'happens before|after|on <date>' filter."""
+    words = _split_clause(line, 2)
+    if words is None:
+        return None
+
+    _, operator, date_str = words
+    if operator not in DATE_OPERATORS:
+        return None
+
+    target_date = resolve_date(date_str)
+    if target_date is None:
+        return None
+
+    return HappensFilter(operator, target_date)
+
+
+def _parse_has_filter(line: str) -> Optional[Filter]:
+    """Parse a 'has|no <field> date' filter."""
+    words = line.split()
+    if len(words) != 3 or words[1] not in HAS_FILTER_FIELDS or words[2] != 'date':
+        return None
+
+    has_or_no, field, _ = words
+
+    has = (has_or_no == 'has')
+    return HasFilter(field, has)
+
+
+def _parse_priority_filter(line: str) -> Optional[Filter]:
+    """Parse a 'priority is ...' filter."""
+    words = _split_clause(line, 2)
+    if words is None or words[1] != 'is':
+        return None
+
+    return parse_priority_clause(words[2])
+
+
+def _split_clause(line: str, maxsplit: int) -> Optional[list[str]]:
+    """Split a clause into maxsplit leading words and the rest of the line.
+
+    Args:
+        line: Stripped, lowercased query line
+        maxsplit: Number of leading words to split off
+
+    Returns:
+        List of maxsplit + 1 parts, or None if the line has fewer words or
+        the trailing argument spans several lines
+    """
+    words = line.split(None, maxsplit)
+    if len(words) != maxsplit + 1 or '\n' in words[-1]:
+        return None
+    return words
+
+
+def _parse_boolean_expr(line: str) -> Optional[Filter]:
+    """Parse a '(<filter>) AND|OR (<filter>)' expression."""
+    split = _split_boolean_expr(line)
+    if split is None:
+        return None
+
+    left_expr, operator, right_expr = split
+
+    left_filter = _parse_normalized_line(left_expr)
+    right_filter = _parse_normalized_line(right_expr)
+
+    if left_filter is None or right_filter is None:
+        return None
+
+    if operator == 'and':
+        return AndFilter([left_filter, right_filter])
+    elif operator == 'or':
+        return OrFilter([left_filter, right_filter])
+
+    return None
+
+
+def _split_boolean_expr(line: str) -> Optional[tuple[str, str, str]]:
+    """Split a boolean expression into (left, operator, right).
+
+    The left operand ends at the parenthesis matching the opening one, so
+    operands may themselves be parenthesized boolean expressions and
+    malformed input fails in a single linear scan.
+
+    Args:
+        line: Lowercased query line starting with '('
+
+    Returns:
+        Tuple of (left_expr, 'and' or 'or', right_expr), or None if invalid
+    """
+    depth = 0
+    for i, char in enumerate(line):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                break
+    else:
+        # Unbalanced parentheses
+        return None
+
+    left_expr = line[1:i].strip()
+    if not left_expr:
+        return None
+
+    match = BOOLEAN_OPERATOR_PATTERN.match(line, i + 1)
+    if not match:
+        return None
+
+    return left_expr, match.group(1), match.group(2).strip()
+
+
+# Line parser for each (lowercase) first word of a query line
+_LINE_PARSERS = {
+    'done': _parse_done_line,
+    'not': _parse_not_done,
+    'due': _parse_date_filter,
+    'scheduled': _parse_date_filter,
+    'start': _parse_date_filter,
+    'happens': _parse_happens_filter,
+    'has': _parse_has_filter,
+    'no': _parse_has_filter,
+    'priority': _parse_priority_filter,
+}
+
+
 def parse_priority_clause(clause: str) -> Optional[Filter]:
     """Parse a priority clause into a PriorityFilter.
 
@@ -167,25 +276,15 @@ def parse_priority_clause(clause: str) -> Optional[Filter]:
         PriorityFilter object, or None if invalid
     """
     # Direct priority match: "priority is highest"
-    if clause in ['highest', 'high', 'medium', 'low', 'lowest', 'none']:
+    if clause in PRIORITY_NAMES:
         return PriorityFilter('is', clause)
 
-    # "priority is not X"
-    if clause.startswith('not '):
-        priority = clause[4:].strip()
-        if priority in ['highest', 'high', 'medium', 'low', 'lowest', 'none']:
-            return PriorityFilter('is_not', priority)
-
-    # "priority is above X"
-    if clause.startswith('above '):
-        priority = clause[6:].strip()
-        if priority in ['highest', 'high', 'medium', 'low', 'lowest', 'none']:
-            return PriorityFilter('above', priority)
-
-    # "priority is below X"
-    if clause.startswith('below '):
-        priority = clause[6:].strip()
-        if priority in ['highest', 'high', 'medium', 'low', 'lowest', 'none']:
-            return PriorityFilter('below', priority)
+    # "priority is not|above|below X"
+    modifier, _, priority = clause.partition(' ')
+    comparison = PRIORITY_MODIFIERS.get(modifier)
+    if comparison is not None:
+        priority = priority.strip()
+        if priority in PRIORITY_NAMES:
+            return PriorityFilter(comparison, priority)
 
     return None
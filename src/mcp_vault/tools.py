@@ -5,12 +5,15 @@ from mcp.types import (
     ImageContent,
     EmbeddedResource,
 )
+import asyncio
 import json
 import os
 from pathlib import Path
 import urllib.parse
 import ssl
 import http.client
+import select
+import threading
 
 from . import implementation
 
@@ -28,6 +31,62 @@ class ToolContext:
         # Obsidian session - set later by server
         self.obsidian_session = None
 
+        # Local REST API connection, opened on first use and kept alive so
+        # repeated requests skip the TLS handshake.
+        # Disable SSL verification (like curl -k)
+        # This is because the plugin uses self-signed certificates for the https communication.
+        self.rest_ssl_context = ssl._create_unverified_context()
+        self._rest_conn = None
+        self._rest_lock = threading.Lock()
+
+    def rest_request(self, method: str, url: str, headers: dict) -> tuple[int, str, str]:
+        """Send a request to the Obsidian Local REST API (blocking).
+
+        Requests share one persistent HTTPS connection. A connection the
+        server has closed while idle is replaced before sending. If a request
+        fails, the connection is discarded and the error re-raised without
+        resending, since the request may already have reached the server.
+
+        Args:
+            method: HTTP method
+            url: Request path, e.g. "/vault/note.md"
+            headers: Request headers
+
+        Returns:
+            Tuple of (status, reason, decoded body)
+        """
+        with self._rest_lock:
+            conn = self._rest_conn
+            if conn is not None and _connection_dropped(conn):
+                conn.close()
+                conn = None
+            if conn is None:
+                # TODO make the connection details configurable
+                conn = self._rest_conn = http.client.HTTPSConnection(
+                    "localhost", 27124, context=self.rest_ssl_context
+                )
+            try:
+                conn.request(method, url, headers=headers)
+                response = conn.getresponse()
+                return response.status, response.reason, response.read().decode()
+            except BaseException:
+                # Whatever failed, the connection may be mid-request
+                conn.close()
+                self._rest_conn = None
+                raise
+
+
+def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Check whether an idle keep-alive connection was closed by the server.
+
+    The server never sends unsolicited data, so a readable idle socket means
+    it has hung up (EOF or TLS close_notify).
+    """
+    if conn.sock is None:
+        return False
+    readable, _, _ = select.select([conn.sock], [], [], 0)
+    return bool(readable)
+
 
 def register_tools(context: ToolContext) -> dict['ToolHandler']:
     """Semi-automatic tool registrar.
@@ -59,10 +118,17 @@ class ToolHandler():
     def __init__(self, tool_name: str, context: ToolContext):
         self.name = tool_name
         self.context = context
+        self._description: Tool | None = None
 
     def get_tool_description(self) -> Tool:
         raise NotImplementedError()
 
+    def tool_description(self) -> Tool:
+        """Return the tool description, built once and reused for every listing."""
+        if self._description is None:
+            self._description = self.get_tool_description()
+        return self._description
+
     async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         raise NotImplementedError()
 
@@ -119,28 +185,20 @@ class MoveFileTool(ToolHandler):
         path_encoded = urllib.parse.quote(path_from)
         dest_encoded = urllib.parse.quote(path_to)
 
-        # Disable SSL verification (like curl -k)
-        # This is because the plugin uses self-signed certificates for the https communication.
-        context = ssl._create_unverified_context()
-
-        conn = http.client.HTTPSConnection("localhost", 27124, context=context)
-        # TODO make the connection details configurable
-
         headers = {
             "Authorization": f"Bearer {self.context.api_token}",
             "Destination": dest_encoded,
         }
 
-        conn.request("MOVE", f"/vault/{path_encoded}", headers=headers)
-        response = conn.getresponse()
+        # Run the blocking request off the event loop
+        status, reason, body = await asyncio.to_thread(
+            self.context.rest_request, "MOVE", f"/vault/{path_encoded}", headers
+        )
 
-        res = f"Status: {response.status} {response.reason}"
-        body = response.read().decode()
+        res = f"Status: {status} {reason}"
         if body:
             res += "\n" + body
 
-        conn.close()
-
         return [TextContent(type="text", text=res)]
 
 
@@ -169,8 +227,10 @@ class ListHeadingsTool(ToolHandler):
     async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle list_headings tool calls."""
 
-        res = implementation.list_headings(self.context.vault_path / args['file_path'])
-        formatted = "\n".join(f"{level} {title}" for level, title in res)
+        res = await asyncio.to_thread(
+            implementation.list_headings, self.context.vault_path / args['file_path']
+        )
+        formatted = "\n".join(f"{'#' * level} {title}" for level, title in res)
         return [TextContent(type="text", text=formatted)]
 
 
@@ -202,7 +262,9 @@ class NailHeadingTool(ToolHandler):
     async def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle nail_heading tool calls."""
 
-        res = implementation.nail_heading(self.context.vault_path / args['file_path'], args['heading'])
+        res = await asyncio.to_thread(
+            implementation.nail_heading, self.context.vault_path / args['file_path'], args['heading']
+        )
         return [TextContent(type="text", text=res)]
 
 
@@ -242,8 +304,9 @@ class AppendToHeadingTool(ToolHandler):
         heading = args['heading']
         content = args['content']
 
-        # 1. Use nail_heading to get the full hierarchical path
-        heading_path = implementation.nail_heading(
+        # 1. Use nail_heading to get the full hierarchical path (reads the file off the event loop)
+        heading_path = await asyncio.to_thread(
+            implementation.nail_heading,
             self.context.vault_path / file_path,
             heading
         )
@@ -397,7 +460,9 @@ class GetRecentDailiesTool(ToolHandler):
         limit = args.get('limit', 7)
         include_content = args.get('include_content', False)
 
-        result = implementation.get_recent_dailies(
+        # Scans the dailies folder, so run it off the event loop
+        result = await asyncio.to_thread(
+            implementation.get_recent_dailies,
             self.context.vault_path,
             limit=limit,
             include_content=include_content
@@ -0,0 +1,69 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_vault.tasks import read_vault_tasks
+
+
+def build_vault(root: Path, files: dict[str, str]) -> Path:
+    """Write a vault from a mapping of relative file path to content.
+
+    Args:
+        root: Vault root directory
+        files: File contents keyed by path relative to the root
+
+    Returns:
+        The vault root
+    """
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return root
+
+
+# Tasks in the shared vault, by file path relative to the vault root
+SHARED_VAULT_TASKS = {
+    '.claude/tasks.md': 'Claude task',
+    'archived/old.md': 'Archived task',
+    'dir1/tasks.md': 'Task 1',
+    'dir2/tasks.md': 'Task 2',
+    'project/tasks.md': 'Project task',
+    'project-archived/old.md': 'Project archived task',
+    'keep.md': 'Keep task',
+}
+
+
+@pytest.fixture(scope="session")
+def shared_vault(tmp_path_factory):
+    """Build one read-only vault with one open task per file.
+
+    Tests that only query the vault share it instead of writing their own.
+    """
+    return build_vault(tmp_path_factory.mktemp("vault"), {
+        relative_path: f'- [ ] {description}\n'
+        for relative_path, description in SHARED_VAULT_TASKS.items()
+    })
+
+
+@pytest.fixture(scope="session")
+def shared_task_descriptions():
+    """Descriptions of every task in the shared vault."""
+    return frozenset(SHARED_VAULT_TASKS.values())
+
+
+@pytest.fixture
+def make_vault(tmp_path):
+    """Fixture returning a helper that writes a vault into tmp_path."""
+    def make(files: dict[str, str]) -> Path:
+        return build_vault(tmp_path, files)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def fixture_tasks():
+    """Parse the task fixture vault once for every test that queries it."""
+    return read_vault_tasks(Path(__file__).parent / 'fixtures' / 'tasks')
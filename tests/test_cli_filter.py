@@ -1,174 +1,137 @@
 """Unit tests for CLI --filter functionality."""
 
-import sys
-import subprocess
-from pathlib import Path
-import json
+from typing import NamedTuple
 import pytest
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    # Optional speedup; fall back to the standard library decoder
+    from json import loads as json_loads
 
-def run_cli(*args):
-    """Helper to run the CLI and capture output."""
-    result = subprocess.run(
-        [sys.executable, '-m', 'mcp_vault.tasks.cli'] + list(args),
-        capture_output=True,
-        text=True
-    )
-    return result
+from mcp_vault.tasks import cli
 
 
-def test_filter_single_path(tmp_path):
-    """Test filtering with a single path prefix."""
-    vault = tmp_path
+class CLIResult(NamedTuple):
+    returncode: int
+    stdout: str
+    stderr: str
 
-    # Create tasks in .claude directory
-    claude_dir = vault / '.claude'
-    claude_dir.mkdir()
-    (claude_dir / 'tasks.md').write_text('- [ ] Claude task\n')
 
-    # Create tasks in root
-    (vault / 'root.md').write_text('- [ ] Root task\n')
+@pytest.fixture
+def run_cli(capsys):
+    """Fixture returning a helper that runs the CLI in-process and captures output."""
+    def run(*args):
+        try:
+            returncode = cli.main(list(args))
+        except SystemExit as e:
+            # argparse exits on usage errors
+            returncode = e.code or 0
+        captured = capsys.readouterr()
+        return CLIResult(returncode, captured.out, captured.err)
 
-    # Query without filter - should see both
-    result = run_cli('not done', str(vault))
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 2
+    return run
 
-    # Query with .claude filter - should only see root task
-    result = run_cli('--filter', '.claude', 'not done', str(vault))
-    assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 1
-    assert data['tasks'][0]['description'] == 'Root task'
-    assert data['tasks'][0]['file_path'] == 'root.md'
 
+def task_descriptions(result):
+    """Parse CLI JSON output into the set of task descriptions."""
+    data = json_loads(result.stdout)
+    assert data['count'] == len(data['tasks'])
+    return {task['description'] for task in data['tasks']}
 
-def test_filter_multiple_paths(tmp_path):
-    """Test filtering with multiple comma-separated path prefixes."""
-    vault = tmp_path
 
-    # Create tasks in different directories
-    (vault / '.claude').mkdir()
-    (vault / '.claude' / 'tasks.md').write_text('- [ ] Claude task\n')
-
-    (vault / 'archived').mkdir()
-    (vault / 'archived' / 'old.md').write_text('- [ ] Archived task\n')
-
-    (vault / 'active.md').write_text('- [ ] Active task\n')
+def test_filter_single_path(shared_vault, run_cli, shared_task_descriptions):
+    """Test filtering with a single path prefix."""
+    # Query without filter - should see every task
+    result = run_cli('not done', str(shared_vault))
+    assert result.returncode == 0
+    assert task_descriptions(result) == shared_task_descriptions
 
-    # Query without filter - should see all 3
-    result = run_cli('not done', str(vault))
+    # Query with .claude filter - should drop only the .claude task
+    result = run_cli('--filter', '.claude', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 3
+    data = json_loads(result.stdout)
+    assert {task['description'] for task in data['tasks']} == shared_task_descriptions - {'Claude task'}
+    keep = next(task for task in data['tasks'] if task['description'] == 'Keep task')
+    assert keep['file_path'] == 'keep.md'
+
 
-    # Query with multiple filters - should only see active task
-    result = run_cli('--filter', '.claude,archived', 'not done', str(vault))
+def test_filter_multiple_paths(shared_vault, run_cli, shared_task_descriptions):
+    """Test filtering with multiple comma-separated path prefixes."""
+    result = run_cli('--filter', '.claude,archived', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 1
-    assert data['tasks'][0]['description'] == 'Active task'
+    assert task_descriptions(result) == shared_task_descriptions - {'Claude task', 'Archived task'}
 
 
-def test_filter_no_matches(tmp_path):
+def test_filter_no_matches(shared_vault, run_cli, shared_task_descriptions):
     """Test that filter with no matches returns all tasks."""
-    vault = tmp_path
-    (vault / 'tasks.md').write_text('- [ ] Task 1\n- [ ] Task 2\n')
-
     # Filter that doesn't match anything
-    result = run_cli('--filter', 'nonexistent', 'not done', str(vault))
+    result = run_cli('--filter', 'nonexistent', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 2
+    assert task_descriptions(result) == shared_task_descriptions
 
 
-def test_filter_all_filtered(tmp_path):
+def test_filter_all_filtered(shared_vault, run_cli):
     """Test filtering out all tasks."""
-    vault = tmp_path
-
-    (vault / '.claude').mkdir()
-    (vault / '.claude' / 'tasks.md').write_text('- [ ] Task 1\n- [ ] Task 2\n')
-
-    # Filter that matches all tasks
-    result = run_cli('--filter', '.claude', 'not done', str(vault))
+    # Filters that together match every file
+    result = run_cli('--filter', '.claude,archived,dir,project,keep', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
+    data = json_loads(result.stdout)
     assert data['count'] == 0
     assert data['tasks'] == []
 
 
-def test_filter_with_spaces(tmp_path):
+def test_filter_with_spaces(shared_vault, run_cli, shared_task_descriptions):
     """Test filtering paths with spaces (after comma splitting)."""
-    vault = tmp_path
-
-    (vault / 'dir1').mkdir()
-    (vault / 'dir1' / 'tasks.md').write_text('- [ ] Task 1\n')
-
-    (vault / 'dir2').mkdir()
-    (vault / 'dir2' / 'tasks.md').write_text('- [ ] Task 2\n')
-
-    (vault / 'keep.md').write_text('- [ ] Keep this\n')
-
     # Comma-separated with spaces
-    result = run_cli('--filter', 'dir1, dir2', 'not done', str(vault))
+    result = run_cli('--filter', 'dir1, dir2', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 1
-    assert data['tasks'][0]['description'] == 'Keep this'
+    assert task_descriptions(result) == shared_task_descriptions - {'Task 1', 'Task 2'}
 
 
-def test_filter_prefix_matching(tmp_path):
+def test_filter_prefix_matching(shared_vault, run_cli, shared_task_descriptions):
     """Test that filtering uses prefix matching, not exact matching."""
-    vault = tmp_path
-
-    (vault / 'project').mkdir()
-    (vault / 'project' / 'tasks.md').write_text('- [ ] Project task\n')
-
-    (vault / 'project-archived').mkdir()
-    (vault / 'project-archived' / 'old.md').write_text('- [ ] Archived task\n')
-
-    (vault / 'other.md').write_text('- [ ] Other task\n')
-
     # Filter 'project' should match both 'project/' and 'project-archived/'
-    result = run_cli('--filter', 'project', 'not done', str(vault))
+    result = run_cli('--filter', 'project', 'not done', str(shared_vault))
     assert result.returncode == 0
-    data = json.loads(result.stdout)
-    assert data['count'] == 1
-    assert data['tasks'][0]['description'] == 'Other task'
+    assert task_descriptions(result) == shared_task_descriptions - {'Project task', 'Project archived task'}
 
 
-def test_filter_error_no_argument(tmp_path):
+def test_filter_error_no_argument(shared_vault, run_cli):
     """Test that --filter without argument shows error."""
-    vault = tmp_path
-    (vault / 'tasks.md').write_text('- [ ] Task\n')
-
-    result = run_cli('--filter', 'not done', str(vault))
+    result = run_cli('--filter', 'not done', str(shared_vault))
     assert result.returncode == 1
     assert 'Error' in result.stderr
 
 
-def test_filter_error_empty_paths(tmp_path):
+def test_filter_error_empty_paths(shared_vault, run_cli):
     """Test that --filter with only commas/whitespace shows error."""
-    vault = tmp_path
-    (vault / 'tasks.md').write_text('- [ ] Task\n')
-
-    result = run_cli('--filter', '  ,  , ', 'not done', str(vault))
+    result = run_cli('--filter', '  ,  , ', 'not done', str(shared_vault))
     assert result.returncode == 1
     assert 'Error' in result.stderr
 
 
-def test_filter_with_raw_output(tmp_path):
+def test_filter_with_raw_output(shared_vault, run_cli):
     """Test that --filter works with --raw flag."""
-    vault = tmp_path
-
-    (vault / '.claude').mkdir()
-    (vault / '.claude' / 'tasks.md').write_text('- [ ] Claude task\n')
-    (vault / 'keep.md').write_text('- [ ] Keep task\n')
-
-    result = run_cli('--raw', '--filter', '.claude', 'not done', str(vault))
+    result = run_cli('--raw', '--filter', '.claude', 'not done', str(shared_vault))
     assert result.returncode == 0
     assert 'Keep task' in result.stdout
     assert 'Claude task' not in result.stdout
 
 
+@pytest.mark.parametrize('indent', [True, False])
+def test_write_json_same_output_without_orjson(capsys, monkeypatch, indent):
+    """Test that the stdlib fallback writes the same bytes as orjson."""
+    output = {"tasks": [{"description": "Ship it ✅"}], "count": 1}
+
+    monkeypatch.setattr(cli, 'orjson', None)
+    cli.write_json(output, indent=indent)
+    fallback = capsys.readouterr().out
+
+    if not indent:
+        assert fallback == '{"tasks":[{"description":"Ship it ✅"}],"count":1}\n'
+
+    orjson = pytest.importorskip('orjson')
+    monkeypatch.setattr(cli, 'orjson', orjson)
+    cli.write_json(output, indent=indent)
+    assert capsys.readouterr().out == fallback
@@ -1,8 +1,8 @@
 """Integration tests for task querying with test fixtures."""
 
 from pathlib import Path
-from datetime import date
-from mcp_vault.tasks import query, read_vault_tasks, execute_query
+from mcp_vault.tasks import executor, query, read_vault_tasks, execute_query
+from mcp_vault.tasks.executor import PARALLEL_CHUNKSIZE
 
 
 def get_fixtures_path():
@@ -33,46 +33,41 @@ def test_query_not_done():
     assert all(not task.is_done for task in results)
 
 
-def test_query_done():
+def test_query_done(fixture_tasks):
     """Test querying for done tasks."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "done")
+    results = execute_query(fixture_tasks, "done")
 
     assert len(results) > 0
     assert all(task.is_done for task in results)
 
 
-def test_query_has_due_date():
+def test_query_has_due_date(fixture_tasks):
     """Test querying for tasks with due date."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "has due date")
+    results = execute_query(fixture_tasks, "has due date")
 
     assert len(results) > 0
     assert all(task.due_date is not None for task in results)
 
 
-def test_query_no_due_date():
+def test_query_no_due_date(fixture_tasks):
     """Test querying for tasks without due date."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "no due date")
+    results = execute_query(fixture_tasks, "no due date")
 
     assert len(results) > 0
     assert all(task.due_date is None for task in results)
 
 
-def test_query_priority_high():
+def test_query_priority_high(fixture_tasks):
     """Test querying for high priority tasks."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "priority is high")
+    results = execute_query(fixture_tasks, "priority is high")
 
     assert len(results) > 0
     assert all(task.priority == 'high' for task in results)
 
 
-def test_query_priority_above_none():
+def test_query_priority_above_none(fixture_tasks):
     """Test querying for tasks with priority above none."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "priority is above none")
+    results = execute_query(fixture_tasks, "priority is above none")
 
     # Above none = highest, high, medium
     valid_priorities = {'highest', 'high', 'medium'}
@@ -80,25 +75,22 @@ def test_query_priority_above_none():
     assert all(task.priority in valid_priorities for task in results)
 
 
-def test_query_multiline_not_done_has_due():
+def test_query_multiline_not_done_has_due(fixture_tasks):
     """Test multi-line query: not done AND has due date."""
-    fixtures_path = get_fixtures_path()
-    results = query(fixtures_path, "not done\nhas due date")
+    results = execute_query(fixture_tasks, "not done\nhas due date")
 
     assert len(results) > 0
     assert all(not task.is_done for task in results)
     assert all(task.due_date is not None for task in results)
 
 
-def test_query_date_relative():
+def test_query_date_relative(fixture_tasks):
     """Test query with relative date (today)."""
-    fixtures_path = get_fixtures_path()
-
     # Note: This test depends on the fixture having tasks with 2025-11-12
     # The test will work when run on different dates because the query
     # uses relative dates which are resolved at query time
     try:
-        results = query(fixtures_path, "due on today")
+        results = execute_query(fixture_tasks, "due on today")
         # Should match tasks with today's date
         assert all(task.due_date is not None for task in results)
     except ValueError:
@@ -106,33 +98,28 @@ def test_query_date_relative():
         pass
 
 
-def test_query_boolean_and():
+def test_query_boolean_and(fixture_tasks):
     """Test boolean AND query."""
-    fixtures_path = get_fixtures_path()
-
     # Complex query with AND
     query_str = "(not done) AND (has due date)"
-    results = query(fixtures_path, query_str)
+    results = execute_query(fixture_tasks, query_str)
 
     # Results should satisfy both conditions
     assert all(not task.is_done for task in results)
     assert all(task.due_date is not None for task in results)
 
 
-def test_query_no_results():
+def test_query_no_results(fixture_tasks):
     """Test query that returns no results."""
-    fixtures_path = get_fixtures_path()
-
     # Query for a very specific condition unlikely to match
     # (e.g., due on a far future date)
-    results = query(fixtures_path, "due on 2099-12-31")
+    results = execute_query(fixture_tasks, "due on 2099-12-31")
     assert len(results) == 0
 
 
-def test_execute_query_with_tasks():
+def test_execute_query_with_tasks(fixture_tasks):
     """Test execute_query directly with a task list."""
-    fixtures_path = get_fixtures_path()
-    all_tasks = read_vault_tasks(fixtures_path)
+    all_tasks = fixture_tasks
 
     # Filter to just done tasks
     results = execute_query(all_tasks, "done")
@@ -143,17 +130,14 @@ def test_execute_query_with_tasks():
     assert len(results) < len(all_tasks)
 
 
-def test_query_complex_agenda_scenario():
+def test_query_complex_agenda_scenario(fixture_tasks):
     """Test a complex real-world query similar to Agenda.md."""
-    fixtures_path = get_fixtures_path()
-
     # Simulate "Overdue" query: not done + happens before today
     # Note: This depends on fixture dates
-    all_tasks = read_vault_tasks(fixtures_path)
 
     # Just verify the query parses and runs without error
     try:
-        results = query(fixtures_path, "not done\nhappens before today")
+        results = execute_query(fixture_tasks, "not done\nhappens before today")
         # All results should be not done
         assert all(not task.is_done for task in results)
     except ValueError:
@@ -161,11 +145,9 @@ def test_query_complex_agenda_scenario():
         pass
 
 
-def test_query_priority_and_status():
+def test_query_priority_and_status(fixture_tasks):
     """Test combining priority and status filters."""
-    fixtures_path = get_fixtures_path()
-
-    results = query(fixtures_path, "not done\npriority is high")
+    results = execute_query(fixture_tasks, "not done\npriority is high")
 
     # Should have at least some results
     if len(results) > 0:
@@ -181,14 +163,58 @@ def test_empty_vault(tmp_path):
     assert len(results) == 0
 
 
-def test_query_error_handling():
+def test_query_error_handling(fixture_tasks):
     """Test that invalid queries raise ValueError."""
-    fixtures_path = get_fixtures_path()
-
     try:
-        query(fixtures_path, "invalid query syntax here")
+        execute_query(fixture_tasks, "invalid query syntax here")
         assert False, "Should have raised ValueError"
     except ValueError as e:
         assert "parse error" in str(e).lower()
 
 
+def test_read_vault_tasks_parallel(tmp_path, monkeypatch):
+    """Test that vaults parsed in parallel yield every task."""
+    # Make sure the process pool is used even on single-CPU machines
+    monkeypatch.setattr(executor, 'PARALLEL_MAX_WORKERS', 4)
+
+    file_count = 2 * PARALLEL_CHUNKSIZE + 10
+    for i in range(file_count):
+        (tmp_path / f'note{i}.md').write_text(f'- [ ] Task {i}\n- [x] Done {i}\n', encoding='utf-8')
+
+    tasks = read_vault_tasks(tmp_path, parallel=True)
+
+    assert len(tasks) == file_count * 2
+    descriptions = {task.description for task in tasks}
+    assert f'Task {file_count - 1}' in descriptions
+    assert 'Done 0' in descriptions
+
+
+def test_read_vault_tasks_line_endings(tmp_path):
+    """Test CRLF files and task-free notes are handled correctly."""
+    (tmp_path / 'windows.md').write_bytes(b'# Note\r\n\r\n- [ ] CRLF task\r\n')
+    (tmp_path / 'prose.md').write_text('# Just prose\n\nNo checkboxes here.\n', encoding='utf-8')
+
+    tasks = read_vault_tasks(tmp_path)
+
+    assert len(tasks) == 1
+    assert tasks[0].description == 'CRLF task'
+    assert tasks[0].line_number == 3
+    assert tasks[0].source_line == '- [ ] CRLF task'
+
+
+def test_read_vault_tasks_exclude_prefixes(make_vault):
+    """Test that excluded path prefixes are skipped during the walk."""
+    vault = make_vault({
+        'project/sub/deep.md': '- [ ] Deep task\n',
+        'project-archived/old.md': '- [ ] Archived task\n',
+        'projects.md': '- [ ] Projects note task\n',
+        'other.md': '- [ ] Other task\n',
+    })
+
+    tasks = read_vault_tasks(vault, exclude_prefixes=('project',))
+    assert [task.description for task in tasks] == ['Other task']
+
+    tasks = read_vault_tasks(vault, exclude_prefixes=('project/sub',))
+    assert sorted(task.description for task in tasks) == [
+        'Archived task', 'Other task', 'Projects note task',
+    ]
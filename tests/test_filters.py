@@ -1,6 +1,9 @@
 """Unit tests for filter implementations."""
 
 from datetime import date
+
+import pytest
+
 from mcp_vault.tasks.models import Task
 from mcp_vault.tasks.filters import (
     StatusFilter,
@@ -11,9 +14,14 @@ from mcp_vault.tasks.filters import (
     AndFilter,
     OrFilter,
     NotFilter,
+    compile_predicate,
 )
 
 
+# Comparison date used by most date filters below
+TARGET_DATE = date(2025, 11, 15)
+
+
 # Helper function to create test tasks
 def create_task(status=' ', description='Test', priority=None, due_date=None,
                 scheduled_date=None, start_date=None, done_date=None, created_date=None):
@@ -33,6 +41,11 @@ def create_task(status=' ', description='Test', priority=None, due_date=None,
     )
 
 
+def match_results(filter_obj, tasks):
+    """Return filter_obj.matches() for each task, in order."""
+    return list(map(filter_obj.matches, tasks))
+
+
 def test_status_filter_done():
     """Test StatusFilter for done tasks."""
     filter_obj = StatusFilter('done')
@@ -57,7 +70,7 @@ def test_status_filter_not_done():
 
 def test_date_filter_due_before():
     """Test DateFilter with due date before."""
-    filter_obj = DateFilter('due', 'before', date(2025, 11, 15))
+    filter_obj = DateFilter('due', 'before', TARGET_DATE)
 
     task_before = create_task(due_date=date(2025, 11, 10))
     task_after = create_task(due_date=date(2025, 11, 20))
@@ -70,7 +83,7 @@ def test_date_filter_due_before():
 
 def test_date_filter_due_after():
     """Test DateFilter with due date after."""
-    filter_obj = DateFilter('due', 'after', date(2025, 11, 15))
+    filter_obj = DateFilter('due', 'after', TARGET_DATE)
 
     task_before = create_task(due_date=date(2025, 11, 10))
     task_after = create_task(due_date=date(2025, 11, 20))
@@ -81,9 +94,9 @@ def test_date_filter_due_after():
 
 def test_date_filter_due_on():
     """Test DateFilter with due date on."""
-    filter_obj = DateFilter('due', 'on', date(2025, 11, 15))
+    filter_obj = DateFilter('due', 'on', TARGET_DATE)
 
-    task_same = create_task(due_date=date(2025, 11, 15))
+    task_same = create_task(due_date=TARGET_DATE)
     task_different = create_task(due_date=date(2025, 11, 16))
 
     assert filter_obj.matches(task_same) is True
@@ -92,7 +105,7 @@ def test_date_filter_due_on():
 
 def test_date_filter_scheduled():
     """Test DateFilter with scheduled field."""
-    filter_obj = DateFilter('scheduled', 'before', date(2025, 11, 15))
+    filter_obj = DateFilter('scheduled', 'before', TARGET_DATE)
 
     task = create_task(scheduled_date=date(2025, 11, 10))
     assert filter_obj.matches(task) is True
@@ -100,7 +113,7 @@ def test_date_filter_scheduled():
 
 def test_date_filter_start():
     """Test DateFilter with start field."""
-    filter_obj = DateFilter('start', 'after', date(2025, 11, 15))
+    filter_obj = DateFilter('start', 'after', TARGET_DATE)
 
     task = create_task(start_date=date(2025, 11, 20))
     assert filter_obj.matches(task) is True
@@ -108,96 +121,68 @@ def test_date_filter_start():
 
 def test_happens_filter():
     """Test HappensFilter checks any of start/scheduled/due."""
-    filter_obj = HappensFilter('before', date(2025, 11, 15))
-
-    # Task with only due date matching
-    task_due = create_task(due_date=date(2025, 11, 10))
-    assert filter_obj.matches(task_due) is True
-
-    # Task with only scheduled date matching
-    task_scheduled = create_task(scheduled_date=date(2025, 11, 12))
-    assert filter_obj.matches(task_scheduled) is True
-
-    # Task with only start date matching
-    task_start = create_task(start_date=date(2025, 11, 13))
-    assert filter_obj.matches(task_start) is True
-
-    # Task with no dates
-    task_no_dates = create_task()
-    assert filter_obj.matches(task_no_dates) is False
-
-    # Task with dates all after target
-    task_all_after = create_task(
-        start_date=date(2025, 11, 16),
-        scheduled_date=date(2025, 11, 17),
-        due_date=date(2025, 11, 18)
-    )
-    assert filter_obj.matches(task_all_after) is False
-
-
-def test_priority_filter_is():
-    """Test PriorityFilter with 'is' comparison."""
-    filter_high = PriorityFilter('is', 'high')
-
-    task_high = create_task(priority='high')
-    task_medium = create_task(priority='medium')
-    task_none = create_task(priority=None)
-
-    assert filter_high.matches(task_high) is True
-    assert filter_high.matches(task_medium) is False
-    assert filter_high.matches(task_none) is False
-
-
-def test_priority_filter_is_not():
-    """Test PriorityFilter with 'is_not' comparison."""
-    filter_obj = PriorityFilter('is_not', 'high')
-
-    task_high = create_task(priority='high')
-    task_medium = create_task(priority='medium')
-
-    assert filter_obj.matches(task_high) is False
-    assert filter_obj.matches(task_medium) is True
-
-
-def test_priority_filter_above():
-    """Test PriorityFilter with 'above' comparison."""
-    filter_obj = PriorityFilter('above', 'medium')
-
+    filter_obj = HappensFilter('before', TARGET_DATE)
+
+    tasks = [
+        # Task with only due date matching
+        create_task(due_date=date(2025, 11, 10)),
+        # Task with only scheduled date matching
+        create_task(scheduled_date=date(2025, 11, 12)),
+        # Task with only start date matching
+        create_task(start_date=date(2025, 11, 13)),
+        # Task with no dates
+        create_task(),
+        # Task with dates all after target
+        create_task(
+            start_date=date(2025, 11, 16),
+            scheduled_date=date(2025, 11, 17),
+            due_date=date(2025, 11, 18)
+        ),
+    ]
+
+    assert match_results(filter_obj, tasks) == [True, True, True, False, False]
+
+
+@pytest.mark.parametrize("operator,expected", [
+    ('before', [True, False, False]),
+    ('after', [True, True, False]),
+    ('on', [False, True, False]),
+])
+def test_happens_filter_date_range(operator, expected):
+    """Test HappensFilter on tasks whose dates span the target."""
+    filter_obj = HappensFilter(operator, TARGET_DATE)
+
+    tasks = [
+        create_task(start_date=date(2025, 11, 10), due_date=date(2025, 11, 20)),
+        create_task(scheduled_date=TARGET_DATE, due_date=date(2025, 11, 20)),
+        create_task(done_date=date(2025, 11, 10)),
+    ]
+
+    assert match_results(filter_obj, tasks) == expected
+    assert list(map(compile_predicate([filter_obj]), tasks)) == expected
+
+
+@pytest.mark.parametrize("comparison,target,priorities,expected", [
+    ('is', 'high', ['high', 'medium', None], [True, False, False]),
+    ('is_not', 'high', ['high', 'medium'], [False, True]),
     # Above medium = highest, high
-    task_highest = create_task(priority='highest')
-    task_high = create_task(priority='high')
-    task_medium = create_task(priority='medium')
-    task_low = create_task(priority='low')
-
-    assert filter_obj.matches(task_highest) is True
-    assert filter_obj.matches(task_high) is True
-    assert filter_obj.matches(task_medium) is False
-    assert filter_obj.matches(task_low) is False
-
-
-def test_priority_filter_below():
-    """Test PriorityFilter with 'below' comparison."""
-    filter_obj = PriorityFilter('below', 'medium')
-
+    ('above', 'medium', ['highest', 'high', 'medium', 'low'], [True, True, False, False]),
     # Below medium = none, low, lowest
-    task_high = create_task(priority='high')
-    task_medium = create_task(priority='medium')
-    task_none = create_task(priority=None)
-    task_low = create_task(priority='low')
-    task_lowest = create_task(priority='lowest')
+    ('below', 'medium', ['high', 'medium', None, 'low', 'lowest'], [False, False, True, True, True]),
+])
+def test_priority_filter(comparison, target, priorities, expected):
+    """Test PriorityFilter comparisons."""
+    filter_obj = PriorityFilter(comparison, target)
+    tasks = [create_task(priority=p) for p in priorities]
 
-    assert filter_obj.matches(task_high) is False
-    assert filter_obj.matches(task_medium) is False
-    assert filter_obj.matches(task_none) is True
-    assert filter_obj.matches(task_low) is True
-    assert filter_obj.matches(task_lowest) is True
+    assert match_results(filter_obj, tasks) == expected
 
 
 def test_has_filter_has_due():
     """Test HasFilter for presence of due date."""
     filter_obj = HasFilter('due', True)
 
-    task_with_due = create_task(due_date=date(2025, 11, 15))
+    task_with_due = create_task(due_date=TARGET_DATE)
     task_without_due = create_task(due_date=None)
 
     assert filter_obj.matches(task_with_due) is True
@@ -208,7 +193,7 @@ def test_has_filter_no_due():
     """Test HasFilter for absence of due date."""
     filter_obj = HasFilter('due', False)
 
-    task_with_due = create_task(due_date=date(2025, 11, 15))
+    task_with_due = create_task(due_date=TARGET_DATE)
     task_without_due = create_task(due_date=None)
 
     assert filter_obj.matches(task_with_due) is False
@@ -234,6 +219,25 @@ def test_and_filter():
     assert and_filter.matches(task_partial2) is False
 
 
+def test_and_filter_child_order():
+    """Test that AndFilter evaluates cheap children first but keeps source order."""
+    happens = HappensFilter('before', TARGET_DATE)
+    status = StatusFilter('not_done')
+    and_filter = AndFilter([happens, status])
+
+    assert and_filter.filters == (happens, status)
+
+    tasks = [
+        create_task(status=' ', due_date=date(2025, 11, 10)),
+        create_task(status='x', due_date=date(2025, 11, 10)),
+        create_task(status=' ', due_date=date(2025, 11, 20)),
+        create_task(status=' '),
+    ]
+    expected = [happens.matches(t) and status.matches(t) for t in tasks]
+    assert match_results(and_filter, tasks) == expected
+    assert list(map(compile_predicate([and_filter]), tasks)) == expected
+
+
 def test_or_filter():
     """Test OrFilter combines filters with OR logic."""
     filter1 = PriorityFilter('is', 'high')
@@ -266,3 +270,49 @@ def test_not_filter():
     assert not_filter.matches(not_done_task) is True
 
 
+def test_apply_filters_order_independent():
+    """Test that filter reordering does not change results."""
+    from mcp_vault.tasks.executor import apply_filters
+
+    tasks = [
+        create_task(status='x', due_date=date(2025, 11, 10)),
+        create_task(status=' ', due_date=date(2025, 11, 20), priority='high'),
+        create_task(status=' ', scheduled_date=date(2025, 11, 5)),
+        create_task(status=' '),
+    ]
+    filters = [
+        HappensFilter('before', TARGET_DATE),
+        StatusFilter('not_done'),
+        HasFilter('due', False),
+    ]
+
+    assert apply_filters(tasks, filters) == [tasks[2]]
+    assert apply_filters(tasks, list(reversed(filters))) == [tasks[2]]
+    assert apply_filters(tasks, []) == tasks
+
+
+def test_compile_predicate_matches_filters():
+    """Test that compiled predicates agree with Filter.matches."""
+    tasks = [
+        create_task(status='x', done_date=date(2025, 11, 10)),
+        create_task(status=' ', due_date=date(2025, 11, 20), priority='high'),
+        create_task(status='/', scheduled_date=date(2025, 11, 5), priority='low'),
+        create_task(status=' ', start_date=TARGET_DATE),
+        create_task(status='-'),
+    ]
+    filter_sets = [
+        [],
+        [StatusFilter('done')],
+        [StatusFilter('not_done'), HasFilter('due', True)],
+        [DateFilter('due', 'after', TARGET_DATE)],
+        [HappensFilter('on', TARGET_DATE)],
+        [PriorityFilter('above', 'none'), PriorityFilter('is_not', 'high')],
+        [HasFilter('created', False), PriorityFilter('below', 'medium')],
+        [OrFilter([StatusFilter('done'), NotFilter(HasFilter('start', False))])],
+        [AndFilter([HappensFilter('before', date(2025, 11, 30)), StatusFilter('not_done')])],
+    ]
+
+    for filters in filter_sets:
+        predicate = compile_predicate(filters)
+        for task in tasks:
+            assert predicate(task) == all(f.matches(task) for f in filters)
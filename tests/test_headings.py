@@ -0,0 +1,51 @@
+"""Unit tests for markdown heading parsing."""
+
+from mcp_vault.implementation import (
+    parse_headings,
+    find_heading_chain,
+    nail_heading,
+)
+
+
+SAMPLE_NOTE = """# Project
+Intro text
+
+## Tasks
+### Open
+### Done
+## Notes
+#hashtag is not a heading
+# Archive
+"""
+
+
+def test_parse_headings():
+    """Test that headings are parsed with integer levels."""
+    headings = parse_headings(SAMPLE_NOTE)
+
+    assert headings == [
+        (1, 'Project'),
+        (2, 'Tasks'),
+        (3, 'Open'),
+        (3, 'Done'),
+        (2, 'Notes'),
+        (1, 'Archive'),
+    ]
+
+
+def test_find_heading_chain():
+    """Test that heading chains follow heading levels down to the target."""
+    assert find_heading_chain(SAMPLE_NOTE, 'Project') == ['Project']
+    assert find_heading_chain(SAMPLE_NOTE, 'Done') == ['Project', 'Tasks', 'Done']
+    assert find_heading_chain(SAMPLE_NOTE, 'Notes') == ['Project', 'Notes']
+    assert find_heading_chain(SAMPLE_NOTE, 'Missing') is None
+
+
+def test_nail_heading(tmp_path):
+    """Test nailing a heading in a file."""
+    note = tmp_path / 'note.md'
+    note.write_text(SAMPLE_NOTE, encoding='utf-8')
+
+    assert nail_heading(note, 'Done') == 'Project::Tasks::Done'
+    assert nail_heading(note, 'Archive') == 'Archive'
+    assert nail_heading(note, 'Missing') == 'Heading not found!'
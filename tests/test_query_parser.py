@@ -9,6 +9,7 @@ from mcp_vault.tasks.filters import (
     PriorityFilter,
     HasFilter,
     AndFilter,
+    OrFilter,
 )
 
 
@@ -133,6 +134,22 @@ def test_parse_boolean_and():
     assert isinstance(filter_obj.filters[1], DateFilter)
 
 
+def test_parse_boolean_nested():
+    """Test parsing boolean expressions with parenthesized operands."""
+    filter_obj = parse_line("(not done) OR ((has due date) AND (priority is high))")
+    assert isinstance(filter_obj, OrFilter)
+    assert isinstance(filter_obj.filters[0], StatusFilter)
+    assert isinstance(filter_obj.filters[1], AndFilter)
+
+    filter_obj = parse_line("((done) OR (not done)) AND (no due date)")
+    assert isinstance(filter_obj, AndFilter)
+    assert isinstance(filter_obj.filters[0], OrFilter)
+    assert isinstance(filter_obj.filters[1], HasFilter)
+
+    assert parse_line("((done) AND (not done)") is None
+    assert parse_line("(done) AND (not done) OR (done)") is None
+
+
 def test_parse_case_insensitive():
     """Test that parsing is case-insensitive."""
     filter1 = parse_line("DONE")
@@ -194,3 +211,15 @@ happens today"""
     assert "Could not parse line" in query.error
 
 
+def test_parse_query_strict_stops_at_first_error():
+    """Test that strict parsing reports only the first invalid line."""
+    query_source = """done
+invalid line here
+another bad line"""
+
+    query = parse_query(query_source)
+    assert query.error.count("Could not parse line") == 2
+
+    query = parse_query(query_source, strict=True)
+    assert query.error == "Could not parse line: invalid line here"
+    assert query.filters == []
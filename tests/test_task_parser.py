@@ -178,6 +178,22 @@ def test_parse_numbered_task():
     assert task.description == "First numbered task"
 
 
+def test_parse_unusual_task_prefixes():
+    """Test list marker shapes beyond the common '- [ ]' form."""
+    cases = [
+        ("12) [ ] Paren numbered task", ' ', "Paren numbered task"),
+        ("+   [x]   Extra spaces", 'x', "Extra spaces"),
+        ("\t> * [/] Tab and quote", '/', "Tab and quote"),
+        ("\u00a0- [ ] Non-breaking indent", ' ', "Non-breaking indent"),
+    ]
+
+    for line, status, description in cases:
+        task = parse_task_line(line)
+        assert task is not None, f"Should parse as task: {line!r}"
+        assert task.status == status
+        assert task.description == description
+
+
 def test_parse_non_task_lines():
     """Test that non-task lines return None."""
     non_tasks = [
@@ -186,6 +202,9 @@ def test_parse_non_task_lines():
         "- This is a list item without checkbox",
         "",
         "# Heading",
+        "1 [ ] Number without delimiter",
+        "-[ ] No space after marker",
+        "- [] Empty checkbox",
     ]
 
     for line in non_tasks:
@@ -193,6 +212,12 @@ def test_parse_non_task_lines():
         assert task is None
 
 
+def test_parse_long_padded_multiline_line():
+    """Test that long space runs before an embedded newline are rejected quickly."""
+    line = "- [ ] " + " " * 20000 + "x\ny"
+    assert parse_task_line(line) is None
+
+
 def test_parse_wiki_links_not_tasks():
     """Test that Obsidian wiki links are not parsed as tasks."""
     wiki_links = [
@@ -217,12 +242,37 @@ def test_extract_emoji_fields():
     assert fields['due_date'] == date(2025, 11, 12)
 
 
+def test_extract_emoji_fields_repeated_field():
+    """Test that a repeated trailing field stops extraction."""
+    content = "Task 📅 2025-11-01 ⏫ 📅 2025-11-12"
+    fields, description = extract_emoji_fields(content)
+
+    assert fields['due_date'] == date(2025, 11, 12)
+    assert fields['priority'] == 'high'
+    assert description == "Task 📅 2025-11-01"
+
+
+def test_extract_emoji_fields_trailing_run_only():
+    """Test that only the trailing run of fields is extracted."""
+    content = "Task 📅 2025-11-12 then more ⏫"
+    fields, description = extract_emoji_fields(content)
+
+    assert fields['priority'] == 'high'
+    assert fields['due_date'] is None
+    assert description == "Task 📅 2025-11-12 then more"
+
+    content = "Task 📅 2025-11-12   ⏫  "
+    fields, description = extract_emoji_fields(content)
+
+    assert fields['priority'] == 'high'
+    assert fields['due_date'] == date(2025, 11, 12)
+    assert description == "Task"
+
+
 def test_priority_emoji_to_name():
     """Test priority emoji to name conversion."""
     assert priority_emoji_to_name('🔺') == 'highest'
     assert priority_emoji_to_name('⏫') == 'high'
     assert priority_emoji_to_name('🔼') == 'medium'
     assert priority_emoji_to_name('🔽') == 'low'
-    assert priority_emoji_to_name('⏬') == 'lowest'
-
-
+    assert priority_emoji_to_name('⏬') == 'lowest'
\ No newline at end of file